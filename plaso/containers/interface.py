@@ -31,13 +31,16 @@ class AttributeContainer(object):
 
   The CONTAINER_TYPE class attribute contains a string that identifies
   the container type, for example the container type "event" identifiers
-  an event object.
+  an event object. The CONTAINER_TYPE_ID class attribute contains an integer
+  that identifies the container type at runtime and is set when the attribute
+  container class is registered with the attribute containers manager.
 
   Attributes are public class members of an serializable type. Protected and
   private class members are not to be serialized, with the exception of those
   defined in _SERIALIZABLE_PROTECTED_ATTRIBUTES.
   """
   CONTAINER_TYPE = None
+  CONTAINER_TYPE_ID = None
 
   # Names of protected attributes, those with a leading underscore, that
   # should be serialized.
@@ -7,6 +7,10 @@ class AttributeContainersManager(object):
 
   _attribute_container_classes = {}
 
+  # Container type identifiers are not reused when an attribute container
+  # class is deregistered.
+  _container_type_identifiers = {}
+
   @classmethod
   def CreateAttributeContainer(cls, container_type):
     """Creates an instance of a specific attribute container type.
@@ -33,7 +37,8 @@ class AttributeContainersManager(object):
     """Deregisters an attribute container class.
 
     The attribute container classes are identified based on their lower case
-    container type.
+    container type. Deregistering unsets the CONTAINER_TYPE_ID class
+    attribute of the attribute container class.
 
     Args:
       attribute_container_class (type): attribute container class.
@@ -48,6 +53,8 @@ class AttributeContainersManager(object):
           'Attribute container class not set for container type: '
           '{0:s}.'.format(attribute_container_class.CONTAINER_TYPE))
 
+    attribute_container_class.CONTAINER_TYPE_ID = None
+
     del cls._attribute_container_classes[container_type]
 
   @classmethod
@@ -55,7 +62,8 @@ class AttributeContainersManager(object):
     """Registers a attribute container class.
 
     The attribute container classes are identified based on their lower case
-    container type.
+    container type. Registering sets the CONTAINER_TYPE_ID class attribute
+    of the attribute container class.
 
     Args:
       attribute_container_class (type): attribute container class.
@@ -70,6 +78,10 @@ class AttributeContainersManager(object):
           'Attribute container class already set for container type: '
           '{0:s}.').format(attribute_container_class.CONTAINER_TYPE))
 
+    container_type_identifier = cls._container_type_identifiers.setdefault(
+        container_type, len(cls._container_type_identifiers))
+    attribute_container_class.CONTAINER_TYPE_ID = container_type_identifier
+
     cls._attribute_container_classes[container_type] = attribute_container_class
 
   @classmethod
@@ -29,6 +29,7 @@ PYTHON_DEPENDENCIES = {
     'elasticsearch': ('__versionstr__', '7.0', None, False),
     'future': ('__version__', '0.16.0', None, True),
     'idna': ('__version__', '2.5', None, True),
+    'lxml': ('__version__', '4.2.1', None, False),
     'lz4': ('__version__', '0.10.0', None, True),
     'pefile': ('__version__', '2021.5.24', None, True),
     'psutil': ('__version__', '5.4.3', None, True),
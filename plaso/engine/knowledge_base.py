@@ -32,6 +32,7 @@ class KnowledgeBase(object):
     self._mount_path = None
     self._text_prepend = None
     self._time_zone = pytz.UTC
+    self._sorted_user_accounts = {}
     self._user_accounts = {}
     self._values = {}
     self._windows_eventlog_providers = {}
@@ -62,8 +63,17 @@ class KnowledgeBase(object):
 
   @property
   def user_accounts(self):
-    """list[UserAccountArtifact]: user accounts of the current session."""
-    return self._user_accounts.get(self._active_session, {}).values()
+    """tuple[UserAccountArtifact]: user accounts of the current session."""
+    # The user accounts are ordered by identifier. They are sorted when first
+    # read after a change, instead of every time they are read or added.
+    user_accounts = self._sorted_user_accounts.get(self._active_session, None)
+    if user_accounts is None:
+      user_accounts = tuple(sorted(
+          self._user_accounts.get(self._active_session, {}).values(),
+          key=lambda user_account: str(user_account.identifier)))
+      self._sorted_user_accounts[self._active_session] = user_accounts
+
+    return user_accounts
 
   @property
   def year(self):
@@ -132,6 +142,8 @@ class KnowledgeBase(object):
 
     user_accounts[user_account.identifier] = user_account
 
+    self._sorted_user_accounts.pop(session_identifier, None)
+
   def AddWindowsEventLogProvider(
       self, windows_eventlog_provider, session_identifier=None):
     """Adds a Windows Event Log provider.
@@ -412,6 +424,7 @@ class KnowledgeBase(object):
             'Unsupported time zone: {0:s}, defaulting to {1:s}'.format(
                 system_configuration.time_zone, self.timezone.zone))
 
+    self._sorted_user_accounts.pop(session_identifier, None)
     self._user_accounts[session_identifier] = {
         user_account.identifier: user_account
         for user_account in system_configuration.user_accounts}
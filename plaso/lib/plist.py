@@ -1,8 +1,20 @@
 # -*- coding: utf-8 -*-
 """The plist file object."""
 
+import binascii
+import datetime
 import plistlib
 
+from xml.parsers import expat
+
+try:
+  from lxml import etree as lxml_etree
+except ImportError:
+  lxml_etree = None
+
+
+_BINARY_PLIST_SIGNATURE = b'bplist'
+
 
 class PlistFile(object):
   """Class that defines a plist file.
@@ -11,11 +23,165 @@ class PlistFile(object):
     root_key (dict): the plist root key.
   """
 
+  # The format of a XML plist date and time value.
+  _XML_DATE_TIME_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+
   def __init__(self):
     """Initializes the plist file object."""
     super(PlistFile, self).__init__()
     self.root_key = None
 
+  def _GetXMLElementChildren(self, element):
+    """Retrieves the child elements of a XML plist element.
+
+    Args:
+      element (lxml.etree._Element): XML plist element.
+
+    Returns:
+      list[lxml.etree._Element]: child elements, without comments and
+          processing instructions.
+    """
+    return [child for child in element if isinstance(child.tag, str)]
+
+  def _ParseXMLElement(self, element):
+    """Parses a XML plist element.
+
+    Args:
+      element (lxml.etree._Element): XML plist element.
+
+    Returns:
+      object: value of the element.
+
+    Raises:
+      ValueError: if the element is not supported or its value is invalid.
+    """
+    element_tag = element.tag
+    element_text = element.text or ''
+
+    if element_tag == 'dict':
+      children = self._GetXMLElementChildren(element)
+      if len(children) % 2 != 0:
+        raise ValueError('Missing value of dict key.')
+
+      value = {}
+      for key_element, value_element in zip(children[::2], children[1::2]):
+        if key_element.tag != 'key':
+          raise ValueError('Unsupported dict key element: {0!s}.'.format(
+              key_element.tag))
+
+        value[key_element.text or ''] = self._ParseXMLElement(value_element)
+
+      return value
+
+    if element_tag == 'array':
+      return [
+          self._ParseXMLElement(child)
+          for child in self._GetXMLElementChildren(element)]
+
+    # The value of other elements is stored in their text. Child nodes, such
+    # as entity references that were not resolved, would be ignored.
+    if len(element):
+      raise ValueError('Unsupported child nodes of element: {0!s}.'.format(
+          element_tag))
+
+    if element_tag == 'string':
+      return element_text
+
+    if element_tag == 'integer':
+      if element_text.startswith(('0x', '0X')):
+        return int(element_text, 16)
+      return int(element_text, 10)
+
+    if element_tag == 'real':
+      return float(element_text)
+
+    if element_tag == 'true':
+      return True
+
+    if element_tag == 'false':
+      return False
+
+    if element_tag == 'data':
+      try:
+        return binascii.a2b_base64(element_text.encode('ascii'))
+      except (binascii.Error, UnicodeEncodeError) as exception:
+        raise ValueError(exception)
+
+    if element_tag == 'date':
+      return datetime.datetime.strptime(
+          element_text, self._XML_DATE_TIME_FORMAT)
+
+    raise ValueError('Unsupported element: {0!s}.'.format(element_tag))
+
+  def _ReadPlistWithPlistlib(self, data):
+    """Reads a plist using plistlib.
+
+    Args:
+      data (bytes): plist data.
+
+    Returns:
+      object: plist root key.
+
+    Raises:
+      IOError: if the plist cannot be read.
+    """
+    try:
+      return plistlib.loads(data)
+    except (ValueError, expat.ExpatError) as exception:
+      raise IOError(exception)
+
+  def _ReadXMLPlist(self, data):
+    """Reads a XML plist using lxml.
+
+    XML plists that are not supported by the lxml based parsing are read
+    with plistlib instead.
+
+    Args:
+      data (bytes): XML plist data.
+
+    Returns:
+      object: plist root key.
+
+    Raises:
+      IOError: if the XML plist cannot be read.
+    """
+    # Note that lxml is passed the undecoded data so that it can determine
+    # the encoding from the XML declaration.
+    parser = lxml_etree.XMLParser(
+        no_network=True, remove_comments=True, remove_pis=True,
+        resolve_entities=False)
+
+    try:
+      root_element = lxml_etree.fromstring(data, parser=parser)
+    except lxml_etree.XMLSyntaxError:
+      # libxml2 also fails on documents that exceed its resource limits, such
+      # as nesting deeper than 256 elements or text of more than 10 MiB,
+      # which plistlib supports.
+      return self._ReadPlistWithPlistlib(data)
+
+    # plistlib does not support entity declarations, which lxml does not
+    # resolve here. Note that lxml also provides a DTD object for a document
+    # type declaration without internal subset.
+    document_type = root_element.getroottree().docinfo.internalDTD
+    if document_type is not None and any(document_type.iterentities()):
+      return self._ReadPlistWithPlistlib(data)
+
+    if root_element.tag == 'plist':
+      children = self._GetXMLElementChildren(root_element)
+      if len(children) != 1:
+        # plistlib returns None for a plist without root element and the
+        # last root element if there are multiple.
+        return self._ReadPlistWithPlistlib(data)
+
+      root_element = children[0]
+
+    try:
+      return self._ParseXMLElement(root_element)
+    except ValueError:
+      # plistlib supports values that are not parsed here, such as dates
+      # without seconds, and raises a more descriptive error otherwise.
+      return self._ReadPlistWithPlistlib(data)
+
   def GetValueByPath(self, path_segments):
     """Retrieves a plist value by path.
 
@@ -53,6 +219,9 @@ class PlistFile(object):
   def Read(self, file_object):
     """Reads a plist from a file-like object.
 
+    XML plists are read with lxml, if available, and binary plists with
+    plistlib.
+
     Args:
       file_object (dfvfs.FileIO): a file-like object containing plist data.
 
@@ -60,8 +229,20 @@ class PlistFile(object):
       IOError: if the plist file-like object cannot be read.
       OSError: if the plist file-like object cannot be read.
     """
-    try:
-      self.root_key = plistlib.load(file_object)
+    if not lxml_etree:
+      try:
+        self.root_key = plistlib.load(file_object)
+
+      except plistlib.InvalidFileException as exception:
+        raise IOError(exception)
+
+      return
+
+    data = file_object.read()
+
+    if data.startswith(_BINARY_PLIST_SIGNATURE):
+      self.root_key = self._ReadPlistWithPlistlib(data)
+
+    else:
+      self.root_key = self._ReadXMLPlist(data)
 
-    except plistlib.InvalidFileException as exception:
-      raise IOError(exception)
@@ -4,6 +4,8 @@
 import abc
 import plistlib
 
+import pytz
+
 from plaso.containers import artifacts
 from plaso.lib import errors
 from plaso.lib import plist
@@ -177,6 +179,8 @@ class MacOSTimeZonePlugin(interface.FileEntryArtifactPreprocessorPlugin):
 
   ARTIFACT_DEFINITION_NAME = 'MacOSLocalTime'
 
+  _TIME_ZONE_NAMES = frozenset(pytz.all_timezones)
+
   def _ParseFileEntry(self, mediator, file_entry):
     """Parses artifact file system data for a preprocessing attribute.
 
@@ -197,6 +201,14 @@ class MacOSTimeZonePlugin(interface.FileEntryArtifactPreprocessorPlugin):
     _, _, time_zone = file_entry.link.partition('zoneinfo/')
     # TODO: check if time zone is set in knowledge base.
     if time_zone:
+      # Check the time zone name upfront, since unsupported time zone names
+      # are otherwise only detected by the exception pytz raises.
+      if time_zone not in self._TIME_ZONE_NAMES:
+        mediator.ProducePreprocessingWarning(
+            self.ARTIFACT_DEFINITION_NAME,
+            'Unsupported time zone: {0:s}.'.format(time_zone))
+        return
+
       try:
         mediator.knowledge_base.SetTimeZone(time_zone)
       except ValueError:
@@ -1,16 +1,31 @@
 # -*- coding: utf-8 -*-
 """This file contains preprocessors for Windows."""
 
-import os
+import struct
 
 from plaso.containers import artifacts
-from plaso.lib import dtfabric_helper
 from plaso.lib import errors
 from plaso.preprocessors import interface
 from plaso.preprocessors import logger
 from plaso.preprocessors import manager
 
 
+def _RequireString(value_data, artifact_definition_name):
+  """Checks that Windows Registry value data is a string.
+
+  Args:
+    value_data (object): Windows Registry value data.
+    artifact_definition_name (str): name of the artifact definition.
+
+  Raises:
+    errors.PreProcessFail: if the value data is not a string.
+  """
+  if not isinstance(value_data, str):
+    raise errors.PreProcessFail(
+        f'Unsupported Windows Registry value type: {type(value_data)!s} '
+        f'for artifact: {artifact_definition_name:s}.')
+
+
 class WindowsEnvironmentVariableArtifactPreprocessorPlugin(
     interface.WindowsRegistryValueArtifactPreprocessorPlugin):
   """Windows environment variable artifact preprocessor plugin interface."""
@@ -28,24 +43,20 @@ class WindowsEnvironmentVariableArtifactPreprocessorPlugin(
     Raises:
       errors.PreProcessFail: if the preprocessing fails.
     """
-    if not isinstance(value_data, str):
-      raise errors.PreProcessFail(
-          'Unsupported Windows Registry value type: {0!s} for '
-          'artifact: {1:s}.'.format(
-              type(value_data), self.ARTIFACT_DEFINITION_NAME))
+    _RequireString(value_data, self.ARTIFACT_DEFINITION_NAME)
 
     environment_variable = artifacts.EnvironmentVariableArtifact(
         case_sensitive=False, name=self._NAME, value=value_data)
 
     try:
-      logger.debug('setting environment variable: {0:s} to: "{1:s}"'.format(
-          self._NAME, value_data))
+      logger.debug(
+          'setting environment variable: %s to: "%s"', self._NAME, value_data)
       mediator.knowledge_base.AddEnvironmentVariable(environment_variable)
     except KeyError:
       mediator.ProducePreprocessingWarning(
           self.ARTIFACT_DEFINITION_NAME,
-          'Unable to set environment variable: {0:s} in knowledge base.'.format(
-              self._NAME))
+          f'Unable to set environment variable: {self._NAME:s} in knowledge '
+          'base.')
 
 
 class WindowsPathEnvironmentVariableArtifactPreprocessorPlugin(
@@ -75,36 +86,51 @@ class WindowsPathEnvironmentVariableArtifactPreprocessorPlugin(
     relative_path = searcher.GetRelativePath(path_specification)
     if not relative_path:
       raise errors.PreProcessFail(
-          'Unable to read: {0:s} with error: missing relative path'.format(
-              self.ARTIFACT_DEFINITION_NAME))
+          f'Unable to read: {self.ARTIFACT_DEFINITION_NAME:s} with error: '
+          'missing relative path')
 
     if path_separator != file_system.PATH_SEPARATOR:
-      relative_path_segments = file_system.SplitPath(relative_path)
-      relative_path = '{0:s}{1:s}'.format(
-          path_separator, path_separator.join(relative_path_segments))
+      # The fast path does not remove empty path segments, hence it is only
+      # used when the relative path contains no repeated path separators.
+      if (len(path_separator) == 1 and len(file_system.PATH_SEPARATOR) == 1 and
+          file_system.PATH_SEPARATOR * 2 not in relative_path):
+        relative_path = relative_path.strip(file_system.PATH_SEPARATOR)
+        relative_path = ''.join([path_separator, relative_path.replace(
+            file_system.PATH_SEPARATOR, path_separator)])
+      else:
+        relative_path_segments = file_system.SplitPath(relative_path)
+        relative_path = ''.join([
+            path_separator, path_separator.join(relative_path_segments)])
 
     environment_variable = artifacts.EnvironmentVariableArtifact(
         case_sensitive=False, name=self._NAME, value=relative_path)
 
     try:
-      logger.debug('setting environment variable: {0:s} to: "{1:s}"'.format(
-          self._NAME, relative_path))
+      logger.debug(
+          'setting environment variable: %s to: "%s"', self._NAME,
+          relative_path)
       mediator.knowledge_base.AddEnvironmentVariable(environment_variable)
     except KeyError:
       mediator.ProducePreprocessingWarning(
           self.ARTIFACT_DEFINITION_NAME,
-          'Unable to set environment variable: {0:s} in knowledge base.'.format(
-              self._NAME))
+          f'Unable to set environment variable: {self._NAME:s} in knowledge '
+          'base.')
 
 
-class WindowsAllUsersAppDataKnowledgeBasePlugin(
+class WindowsEnvironmentVariableKnowledgeBasePlugin(
     interface.KnowledgeBasePreprocessorPlugin):
-  """The allusersdata knowledge base value plugin.
+  """Windows environment variable knowledge base plugin interface.
 
-  The allusersdata value is needed for the expansion of
-  %%environ_allusersappdata%% in artifact definitions.
+  Derives the value of an environment variable from other environment
+  variables in the knowledge base, when it is not set.
   """
 
+  _NAME = None
+
+  # Names of the environment variables to derive the value from, in order of
+  # preference, and the path segment to append to their value or None.
+  _SOURCES = []
+
   def Collect(self, mediator):
     """Collects values from the knowledge base.
 
@@ -116,30 +142,50 @@ class WindowsAllUsersAppDataKnowledgeBasePlugin(
       PreProcessFail: if the preprocessing fails.
     """
     environment_variable = mediator.knowledge_base.GetEnvironmentVariable(
-        'programdata')
-    allusersappdata = getattr(environment_variable, 'value', None)
+        self._NAME)
+    if environment_variable and environment_variable.value:
+      return
 
-    if not allusersappdata:
+    value = None
+    for name, path_segment in self._SOURCES:
       environment_variable = mediator.knowledge_base.GetEnvironmentVariable(
-          'allusersprofile')
-      allusersdata = getattr(environment_variable, 'value', None)
+          name)
+      if environment_variable and environment_variable.value:
+        value = environment_variable.value
+        if path_segment:
+          value = '\\'.join([value, path_segment])
+        break
+
+    if not value:
+      return
 
-      if allusersdata:
-        allusersappdata = '\\'.join([allusersdata, 'Application Data'])
+    environment_variable = artifacts.EnvironmentVariableArtifact(
+        case_sensitive=False, name=self._NAME, value=value)
 
-    if allusersappdata:
-      environment_variable = artifacts.EnvironmentVariableArtifact(
-          case_sensitive=False, name='allusersappdata', value=allusersappdata)
+    try:
+      logger.debug(
+          'setting environment variable: %s to: "%s"', self._NAME, value)
+      mediator.knowledge_base.AddEnvironmentVariable(environment_variable)
+    except KeyError:
+      mediator.ProducePreprocessingWarning(
+          self.__class__.__name__,
+          f'Unable to set environment variable: {self._NAME:s} in knowledge '
+          'base.')
 
-      try:
-        logger.debug('setting environment variable: {0:s} to: "{1:s}"'.format(
-            'allusersappdata', allusersappdata))
-        mediator.knowledge_base.AddEnvironmentVariable(environment_variable)
-      except KeyError:
-        mediator.ProducePreprocessingWarning(
-            self.__class__.__name__,
-            ('Unable to set environment variable: %AllUsersAppData% in '
-             'knowledge base.'))
+
+class WindowsAllUsersAppDataKnowledgeBasePlugin(
+    WindowsEnvironmentVariableKnowledgeBasePlugin):
+  """The allusersdata knowledge base value plugin.
+
+  The allusersdata value is needed for the expansion of
+  %%environ_allusersappdata%% in artifact definitions.
+  """
+
+  _NAME = 'allusersappdata'
+
+  _SOURCES = [
+      ('programdata', None),
+      ('allusersprofile', 'Application Data')]
 
 
 class WindowsAllUsersProfileEnvironmentVariablePlugin(
@@ -152,7 +198,7 @@ class WindowsAllUsersProfileEnvironmentVariablePlugin(
 
 
 class WindowsAllUsersAppProfileKnowledgeBasePlugin(
-    interface.KnowledgeBasePreprocessorPlugin):
+    WindowsEnvironmentVariableKnowledgeBasePlugin):
   """The allusersprofile knowledge base value plugin.
 
   The allusersprofile value is needed for the expansion of
@@ -162,49 +208,27 @@ class WindowsAllUsersAppProfileKnowledgeBasePlugin(
   that do not define %AllUsersProfile%.
   """
 
-  def Collect(self, mediator):
-    """Collects values from the knowledge base.
-
-    Args:
-      mediator (PreprocessMediator): mediates interactions between preprocess
-          plugins and other components, such as storage and knowledge base.
-
-    Raises:
-      PreProcessFail: if the preprocessing fails.
-    """
-    environment_variable = mediator.knowledge_base.GetEnvironmentVariable(
-        'allusersprofile')
-    allusersprofile = getattr(environment_variable, 'value', None)
-
-    if not allusersprofile:
-      environment_variable = mediator.knowledge_base.GetEnvironmentVariable(
-          'programdata')
-      allusersprofile = getattr(environment_variable, 'value', None)
-
-      if allusersprofile:
-        environment_variable = artifacts.EnvironmentVariableArtifact(
-            case_sensitive=False, name='allusersprofile', value=allusersprofile)
+  _NAME = 'allusersprofile'
 
-        try:
-          logger.debug('setting environment variable: {0:s} to: "{1:s}"'.format(
-              'allusersprofile', allusersprofile))
-          mediator.knowledge_base.AddEnvironmentVariable(environment_variable)
-        except KeyError:
-          mediator.ProducePreprocessingWarning(
-              self.__class__.__name__,
-              ('Unable to set environment variable: %AllUsersProfile% in '
-               'knowledge base.'))
+  _SOURCES = [('programdata', None)]
 
 
 class WindowsAvailableTimeZonesPlugin(
-    interface.WindowsRegistryKeyArtifactPreprocessorPlugin,
-    dtfabric_helper.DtFabricHelper):
+    interface.WindowsRegistryKeyArtifactPreprocessorPlugin):
   """The Windows available time zones plugin."""
 
   ARTIFACT_DEFINITION_NAME = 'WindowsAvailableTimeZones'
 
-  _DEFINITION_FILE = os.path.join(
-      os.path.dirname(__file__), 'time_zone_information.yaml')
+  # The time zone information (TZI) record (TIME_ZONE_INFORMATION or
+  # _REG_TZI_FORMAT) consists of:
+  # * bias (int32)
+  # * standard bias (int32)
+  # * daylight bias (int32)
+  # * standard date (SYSTEMTIME, 8 x uint16)
+  # * daylight date (SYSTEMTIME, 8 x uint16)
+  _TZI_RECORD = struct.Struct('<3i8H8H')
+
+  _TIME_ZONE_VALUE_NAMES = frozenset(['mui_std', 'std', 'tzi'])
 
   def _ParseKey(self, mediator, registry_key, value_name):
     """Parses a Windows Registry key for a preprocessing attribute.
@@ -218,26 +242,33 @@ class WindowsAvailableTimeZonesPlugin(
     Raises:
       errors.PreProcessFail: if the preprocessing fails.
     """
-    std_value = registry_key.GetValueByName('Std')
+    registry_values = {}
+    for registry_value in registry_key.GetValues():
+      # Note that Windows Registry value names are case insensitive.
+      registry_value_name = (registry_value.name or '').lower()
+      if registry_value_name in self._TIME_ZONE_VALUE_NAMES:
+        registry_values[registry_value_name] = registry_value
+
+    tzi_value = registry_values.get('tzi', None)
+    if not tzi_value:
+      mediator.ProducePreprocessingWarning(
+          self.ARTIFACT_DEFINITION_NAME,
+          'TZI value missing from Windows Registry key: '
+          f'{registry_key.path:s}')
+      return
+
+    std_value = registry_values.get('std', None)
     if std_value:
       localized_name = std_value.GetDataAsObject()
     else:
       localized_name = registry_key.name
 
-    mui_std_value = registry_key.GetValueByName('MUI_Std')
+    mui_std_value = registry_values.get('mui_std', None)
     if mui_std_value:
-      mui_form = std_value.GetDataAsObject()
+      mui_form = mui_std_value.GetDataAsObject()
     else:
       mui_form = None
 
-    tzi_value = registry_key.GetValueByName('TZI')
-    if not tzi_value:
-      mediator.ProducePreprocessingWarning(
-          self.ARTIFACT_DEFINITION_NAME,
-          'TZI value missing from Windows Registry key: {0:s}'.format(
-              registry_key.key_path))
-      return
-
     time_zone_artifact = artifacts.TimeZoneArtifact(
         localized_name=localized_name, mui_form=mui_form,
         name=registry_key.name)
@@ -248,9 +279,8 @@ class WindowsAvailableTimeZonesPlugin(
     except (ValueError, errors.ParseError) as exception:
       mediator.ProducePreprocessingWarning(
           self.ARTIFACT_DEFINITION_NAME,
-          'Unable to parse TZI record value in Windows Registry key: {0:s} '
-          'with error: {2!s}'.format(
-              registry_key.key_path, exception))
+          ('Unable to parse TZI record value in Windows Registry key: '
+           f'{registry_key.path:s} with error: {exception!s}'))
       return
 
     try:
@@ -258,8 +288,8 @@ class WindowsAvailableTimeZonesPlugin(
     except KeyError:
       mediator.ProducePreprocessingWarning(
           self.ARTIFACT_DEFINITION_NAME,
-          ('Unable to add time zone information: {0:s} to knowledge '
-           'base.').format(registry_key.name))
+          (f'Unable to add time zone information: {registry_key.name:s} to '
+           'knowledge base.'))
 
   def _ParseTZIValue(self, value_data, time_zone_artifact):
     """Parses the time zone information (TZI) value data.
@@ -271,15 +301,16 @@ class WindowsAvailableTimeZonesPlugin(
     Raises:
       ParseError: if the value data could not be parsed.
     """
-    data_type_map = self._GetDataTypeMap('tzi_record')
-
-    tzi_record = self._ReadStructureFromByteStream(
-        value_data, 0, data_type_map)
+    try:
+      bias, standard_bias, _ = self._TZI_RECORD.unpack_from(value_data)[:3]
+    except (TypeError, struct.error) as exception:
+      raise errors.ParseError(
+          f'Unable to parse TZI record with error: {exception!s}')
 
-    if tzi_record.standard_bias:
-      time_zone_artifact.offset = tzi_record.standard_bias
+    if standard_bias:
+      time_zone_artifact.offset = standard_bias
     else:
-      time_zone_artifact.offset = tzi_record.bias
+      time_zone_artifact.offset = bias
 
 
 class WindowsCodepagePlugin(
@@ -299,14 +330,10 @@ class WindowsCodepagePlugin(
     Raises:
       errors.PreProcessFail: if the preprocessing fails.
     """
-    if not isinstance(value_data, str):
-      raise errors.PreProcessFail(
-          'Unsupported Windows Registry value type: {0!s} for '
-          'artifact: {1:s}.'.format(
-              type(value_data), self.ARTIFACT_DEFINITION_NAME))
+    _RequireString(value_data, self.ARTIFACT_DEFINITION_NAME)
 
     # Map the Windows code page name to a Python equivalent name.
-    codepage = 'cp{0:s}'.format(value_data)
+    codepage = f'cp{value_data:s}'
 
     if not mediator.knowledge_base.codepage:
       try:
@@ -323,6 +350,9 @@ class WindowsEventLogProvidersPlugin(
 
   ARTIFACT_DEFINITION_NAME = 'WindowsEventLogProviders'
 
+  _MESSAGE_FILE_VALUE_NAMES = frozenset([
+      'categorymessagefile', 'eventmessagefile', 'parametermessagefile'])
+
   def _ParseKey(self, mediator, registry_key, value_name):
     """Parses a Windows Registry key for a preprocessing attribute.
 
@@ -335,40 +365,32 @@ class WindowsEventLogProvidersPlugin(
     Raises:
       errors.PreProcessFail: if the preprocessing fails.
     """
-    category_message_files = None
-    registry_value = registry_key.GetValueByName('CategoryMessageFile')
-    if registry_value:
-      category_message_files = registry_value.GetDataAsObject()
-      category_message_files = category_message_files.split(';')
-
-    event_message_files = None
-    registry_value = registry_key.GetValueByName('EventMessageFile')
-    if registry_value:
-      event_message_files = registry_value.GetDataAsObject()
-      event_message_files = event_message_files.split(';')
-
-    parameter_message_files = None
-    registry_value = registry_key.GetValueByName('ParameterMessageFile')
-    if registry_value:
-      parameter_message_files = registry_value.GetDataAsObject()
-      parameter_message_files = parameter_message_files.split(';')
-
-    key_path_segments = registry_key.path.split('\\')
-    log_source = key_path_segments[-1]
-    log_type = key_path_segments[-2]
+    message_files = {}
+    for registry_value in registry_key.GetValues():
+      # Note that Windows Registry value names are case insensitive.
+      registry_value_name = (registry_value.name or '').lower()
+      if registry_value_name in self._MESSAGE_FILE_VALUE_NAMES:
+        value_data = registry_value.GetDataAsObject()
+        if value_data:
+          message_files[registry_value_name] = value_data.split(';')
+
+    key_path, _, log_source = registry_key.path.rpartition('\\')
+    _, _, log_type = key_path.rpartition('\\')
 
     windows_event_log_provider = artifacts.WindowsEventLogProviderArtifact(
-        category_message_files=category_message_files,
-        event_message_files=event_message_files, log_source=log_source,
-        log_type=log_type, parameter_message_files=parameter_message_files)
+        category_message_files=message_files.get('categorymessagefile', None),
+        event_message_files=message_files.get('eventmessagefile', None),
+        log_source=log_source, log_type=log_type,
+        parameter_message_files=message_files.get(
+            'parametermessagefile', None))
 
     try:
       mediator.AddWindowsEventLogProvider(windows_event_log_provider)
     except KeyError:
       mediator.ProducePreprocessingWarning(
           self.ARTIFACT_DEFINITION_NAME,
-          ('Unable to set add Windows Event Log provider: {0:s}/{1:s} to '
-           'knowledge base.').format(log_type, log_source))
+          ('Unable to set add Windows Event Log provider: '
+           f'{log_type:s}/{log_source:s} to knowledge base.'))
 
 
 class WindowsHostnamePlugin(
@@ -391,9 +413,8 @@ class WindowsHostnamePlugin(
     if not isinstance(value_data, str):
       if not hasattr(value_data, '__iter__'):
         raise errors.PreProcessFail(
-            'Unsupported Windows Registry value type: {0!s} for '
-            'artifact: {1:s}.'.format(
-                type(value_data), self.ARTIFACT_DEFINITION_NAME))
+            f'Unsupported Windows Registry value type: {type(value_data)!s} '
+            f'for artifact: {self.ARTIFACT_DEFINITION_NAME:s}.')
 
       # If the value data is a multi string only use the first string.
       value_data = value_data[0]
@@ -413,7 +434,7 @@ class WindowsProgramDataEnvironmentVariablePlugin(
 
 
 class WindowsProgramDataKnowledgeBasePlugin(
-    interface.KnowledgeBasePreprocessorPlugin):
+    WindowsEnvironmentVariableKnowledgeBasePlugin):
   """The programdata knowledge base value plugin.
 
   The programdata value is needed for the expansion of %%environ_programdata%%
@@ -423,38 +444,9 @@ class WindowsProgramDataKnowledgeBasePlugin(
   that do not define %ProgramData%.
   """
 
-  def Collect(self, mediator):
-    """Collects values from the knowledge base.
-
-    Args:
-      mediator (PreprocessMediator): mediates interactions between preprocess
-          plugins and other components, such as storage and knowledge base.
-
-    Raises:
-      PreProcessFail: if the preprocessing fails.
-    """
-    environment_variable = mediator.knowledge_base.GetEnvironmentVariable(
-        'programdata')
-    allusersprofile = getattr(environment_variable, 'value', None)
-
-    if not allusersprofile:
-      environment_variable = mediator.knowledge_base.GetEnvironmentVariable(
-          'allusersprofile')
-      allusersprofile = getattr(environment_variable, 'value', None)
-
-      if allusersprofile:
-        environment_variable = artifacts.EnvironmentVariableArtifact(
-            case_sensitive=False, name='programdata', value=allusersprofile)
+  _NAME = 'programdata'
 
-        try:
-          logger.debug('setting environment variable: {0:s} to: "{1:s}"'.format(
-              'programdata', allusersprofile))
-          mediator.knowledge_base.AddEnvironmentVariable(environment_variable)
-        except KeyError:
-          mediator.ProducePreprocessingWarning(
-              self.__class__.__name__,
-              ('Unable to set environment variable: %ProgramData% in '
-               'knowledge base.'))
+  _SOURCES = [('allusersprofile', None)]
 
 
 class WindowsProgramFilesEnvironmentVariablePlugin(
@@ -492,11 +484,7 @@ class WindowsSystemProductPlugin(
     Raises:
       errors.PreProcessFail: if the preprocessing fails.
     """
-    if not isinstance(value_data, str):
-      raise errors.PreProcessFail(
-          'Unsupported Windows Registry value type: {0!s} for '
-          'artifact: {1:s}.'.format(
-              type(value_data), self.ARTIFACT_DEFINITION_NAME))
+    _RequireString(value_data, self.ARTIFACT_DEFINITION_NAME)
 
     if not mediator.knowledge_base.GetValue('operating_system_product'):
       mediator.knowledge_base.SetValue('operating_system_product', value_data)
@@ -528,11 +516,7 @@ class WindowsSystemVersionPlugin(
     Raises:
       errors.PreProcessFail: if the preprocessing fails.
     """
-    if not isinstance(value_data, str):
-      raise errors.PreProcessFail(
-          'Unsupported Windows Registry value type: {0!s} for '
-          'artifact: {1:s}.'.format(
-              type(value_data), self.ARTIFACT_DEFINITION_NAME))
+    _RequireString(value_data, self.ARTIFACT_DEFINITION_NAME)
 
     if not mediator.knowledge_base.GetValue('operating_system_version'):
       mediator.knowledge_base.SetValue('operating_system_version', value_data)
@@ -555,11 +539,7 @@ class WindowsTimeZonePlugin(
     Raises:
       errors.PreProcessFail: if the preprocessing fails.
     """
-    if not isinstance(value_data, str):
-      raise errors.PreProcessFail(
-          'Unsupported Windows Registry value type: {0!s} for '
-          'artifact: {1:s}.'.format(
-              type(value_data), self.ARTIFACT_DEFINITION_NAME))
+    _RequireString(value_data, self.ARTIFACT_DEFINITION_NAME)
 
     # TODO: check if time zone is set in knowledge base.
     try:
@@ -567,8 +547,8 @@ class WindowsTimeZonePlugin(
     except ValueError as execption:
       mediator.ProducePreprocessingWarning(
           self.ARTIFACT_DEFINITION_NAME,
-          'Unable to map: "{0:s}" to time zone with error: {1!s}'.format(
-              value_data, execption))
+          (f'Unable to map: "{value_data:s}" to time zone with error: '
+           f'{execption!s}'))
 
 
 class WindowsUserAccountsPlugin(
@@ -589,9 +569,7 @@ class WindowsUserAccountsPlugin(
       str: basename which is the last path segment.
     """
     # Strip trailing key separators.
-    while path and path[-1] == '\\':
-      path = path[:-1]
-
+    path = path.rstrip('\\')
     if path:
       _, _, path = path.rpartition('\\')
     return path
@@ -624,8 +602,7 @@ class WindowsUserAccountsPlugin(
     except KeyError:
       mediator.ProducePreprocessingWarning(
           self.ARTIFACT_DEFINITION_NAME,
-          ('Unable to add user account: "{0!s}" to knowledge '
-           'base').format(username))
+          f'Unable to add user account: "{username!s}" to knowledge base')
 
 
 class WindowsWinDirEnvironmentVariablePlugin(
@@ -637,7 +614,7 @@ class WindowsWinDirEnvironmentVariablePlugin(
   _NAME = 'windir'
 
 
-manager.PreprocessPluginsManager.RegisterPlugins([
+manager.PreprocessPluginsManager.RegisterPlugins((
     WindowsAllUsersAppDataKnowledgeBasePlugin,
     WindowsAllUsersProfileEnvironmentVariablePlugin,
     WindowsAllUsersAppProfileKnowledgeBasePlugin,
@@ -649,4 +626,4 @@ manager.PreprocessPluginsManager.RegisterPlugins([
     WindowsProgramFilesX86EnvironmentVariablePlugin,
     WindowsSystemProductPlugin, WindowsSystemRootEnvironmentVariablePlugin,
     WindowsSystemVersionPlugin, WindowsTimeZonePlugin,
-    WindowsWinDirEnvironmentVariablePlugin, WindowsUserAccountsPlugin])
+    WindowsWinDirEnvironmentVariablePlugin, WindowsUserAccountsPlugin))
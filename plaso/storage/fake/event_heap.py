@@ -41,14 +41,42 @@ class EventHeap(object):
       yield event
       event = self.PopEvent()
 
-  def PushEvent(self, event, event_index):
-    """Pushes an event onto the heap.
+  def _GetHeapValues(self, event, event_index):
+    """Retrieves the heap values of an event.
 
     Args:
       event (EventObject): event.
       event_index (int): index of the event in the storage.
+
+    Returns:
+      tuple[int, str, int, str, EventObject]: values to sort the event on
+          the heap.
     """
     event_string = event.GetAttributeValuesString()
-    heap_values = (
+    return (
         event.timestamp, event.timestamp_desc, event_index, event_string, event)
+
+  def PushEvent(self, event, event_index):
+    """Pushes an event onto the heap.
+
+    Args:
+      event (EventObject): event.
+      event_index (int): index of the event in the storage.
+    """
+    heap_values = self._GetHeapValues(event, event_index)
     heapq.heappush(self._heap, heap_values)
+
+  def PushEvents(self, events):
+    """Pushes events onto the heap.
+
+    The heap is rebuilt once after all events have been added, which is
+    faster than pushing the events individually.
+
+    Args:
+      events (iterable[tuple[EventObject, int]]): events and their index in
+          the storage.
+    """
+    self._heap.extend(
+        self._GetHeapValues(event, event_index)
+        for event, event_index in events)
+    heapq.heapify(self._heap)
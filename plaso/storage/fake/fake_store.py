@@ -1,9 +1,7 @@
 # -*- coding: utf-8 -*-
 """Fake (in-memory only) store for testing."""
 
-import collections
 import copy
-import itertools
 
 from plaso.lib import definitions
 from plaso.storage import identifiers
@@ -21,6 +19,7 @@ class FakeStore(interface.BaseStore):
       storage_type (Optional[str]): storage type.
     """
     super(FakeStore, self).__init__(storage_type=storage_type)
+    self._attribute_container_indexes = {}
     self._attribute_containers = {}
     self._event_tag_per_event_identifier = {}
     self._is_open = False
@@ -65,13 +64,15 @@ class FakeStore(interface.BaseStore):
 
     lookup_key = identifier.CopyToString()
 
-    containers = self._attribute_containers.get(container.CONTAINER_TYPE, None)
-    if containers is None or lookup_key not in containers:
+    indexes = self._attribute_container_indexes.get(
+        container.CONTAINER_TYPE, {})
+    index = indexes.get(lookup_key, None)
+    if index is None:
       raise IOError(
           'Missing attribute container: {0:s} with identifier: {1:s}'.format(
               container.CONTAINER_TYPE, lookup_key))
 
-    containers[lookup_key] = container
+    self._attribute_containers[container.CONTAINER_TYPE][index] = container
 
   def _WriteNewAttributeContainer(self, container):
     """Writes a new attribute container to the store.
@@ -81,8 +82,9 @@ class FakeStore(interface.BaseStore):
     """
     containers = self._attribute_containers.get(container.CONTAINER_TYPE, None)
     if containers is None:
-      containers = collections.OrderedDict()
+      containers = []
       self._attribute_containers[container.CONTAINER_TYPE] = containers
+      self._attribute_container_indexes[container.CONTAINER_TYPE] = {}
 
     next_sequence_number = self._GetAttributeContainerNextSequenceNumber(
         container.CONTAINER_TYPE)
@@ -94,7 +96,10 @@ class FakeStore(interface.BaseStore):
 
     # Make sure the fake storage preserves the state of the attribute container.
     container = copy.deepcopy(container)
-    containers[lookup_key] = container
+
+    indexes = self._attribute_container_indexes[container.CONTAINER_TYPE]
+    indexes[lookup_key] = len(containers)
+    containers.append(container)
 
     if container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT_TAG:
       event_identifier = container.GetEventIdentifier()
@@ -123,10 +128,14 @@ class FakeStore(interface.BaseStore):
     Returns:
       AttributeContainer: attribute container or None if not available.
     """
-    containers = self._attribute_containers.get(container_type, {})
+    indexes = self._attribute_container_indexes.get(container_type, {})
 
     lookup_key = identifier.CopyToString()
-    return containers.get(lookup_key, None)
+    index = indexes.get(lookup_key, None)
+    if index is None:
+      return None
+
+    return self._attribute_containers[container_type][index]
 
   def GetAttributeContainerByIndex(self, container_type, index):
     """Retrieves a specific attribute container.
@@ -146,13 +155,11 @@ class FakeStore(interface.BaseStore):
       raise IOError('Unsupported attribute container type: {0:s}'.format(
           container_type))
 
-    containers = self._attribute_containers.get(container_type, {})
-    number_of_containers = len(containers)
-    if index < 0 or index >= number_of_containers:
+    containers = self._attribute_containers.get(container_type, [])
+    if index < 0 or index >= len(containers):
       return None
 
-    return next(itertools.islice(
-        containers.values(), index, number_of_containers))
+    return containers[index]
 
   def GetAttributeContainers(self, container_type):
     """Retrieves a specific type of attribute containers.
@@ -163,8 +170,8 @@ class FakeStore(interface.BaseStore):
     Returns:
       generator(AttributeContainers): attribute container generator.
     """
-    containers = self._attribute_containers.get(container_type, {})
-    return iter(containers.values())
+    containers = self._attribute_containers.get(container_type, [])
+    return iter(containers)
 
   def GetEventTagByEventIdentifier(self, event_identifier):
     """Retrieves the event tag related to a specific event identifier.
@@ -197,7 +204,7 @@ class FakeStore(interface.BaseStore):
     Returns:
       int: the number of containers of a specified type.
     """
-    containers = self._attribute_containers.get(container_type, {})
+    containers = self._attribute_containers.get(container_type, [])
     return len(containers)
 
   def GetSortedEvents(self, time_range=None):
@@ -218,19 +225,21 @@ class FakeStore(interface.BaseStore):
       raise IOError('Unable to read from closed storage writer.')
 
     generator = self.GetAttributeContainers(self._CONTAINER_TYPE_EVENT)
-    sorted_events = event_heap.EventHeap()
 
-    for event_index, event in enumerate(generator):
-      if (time_range and (
-          event.timestamp < time_range.start_timestamp or
-          event.timestamp > time_range.end_timestamp)):
-        continue
+    # The event index is used to ensure to sort events with the same date and
+    # time and description in the order they were added to the store.
+    events = (
+        (event, event_index) for event_index, event in enumerate(generator)
+        if not time_range or (
+            time_range.start_timestamp <= event.timestamp <=
+            time_range.end_timestamp))
 
-      # The event index is used to ensure to sort events with the same date and
-      # time and description in the order they were added to the store.
-      sorted_events.PushEvent(event, event_index)
+    sorted_events = event_heap.EventHeap()
+    sorted_events.PushEvents(events)
 
-    return iter(sorted_events.PopEvents())
+    # The events are popped from the heap on demand, hence only the events
+    # that are read are sorted.
+    return sorted_events.PopEvents()
 
   def HasAttributeContainers(self, container_type):
     """Determines if a store contains a specific type of attribute container.
@@ -242,7 +251,7 @@ class FakeStore(interface.BaseStore):
       bool: True if the store contains the specified type of attribute
           containers.
     """
-    containers = self._attribute_containers.get(container_type, {})
+    containers = self._attribute_containers.get(container_type, [])
     return bool(containers)
 
   def Open(self, **kwargs):
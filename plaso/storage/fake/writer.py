@@ -21,6 +21,9 @@ class FakeStorageWriter(writer.StorageWriter):
       storage_type (Optional[str]): storage type.
     """
     super(FakeStorageWriter, self).__init__(storage_type=storage_type)
+    # The fake store is reused when the storage writer is reopened, which
+    # preserves the attribute containers written before it was closed.
+    self._fake_store = fake_store.FakeStore()
     self.task_completion = None
     self.task_start = None
 
@@ -75,11 +78,13 @@ class FakeStorageWriter(writer.StorageWriter):
     if self._store:
       raise IOError('Storage writer already opened.')
 
-    self._store = fake_store.FakeStore()
+    self._store = self._fake_store
     self._store.Open()
 
-    self._first_written_event_source_index = 0
-    self._written_event_source_index = 0
+    number_of_event_sources = self._store.GetNumberOfAttributeContainers(
+        self._CONTAINER_TYPE_EVENT_SOURCE)
+    self._first_written_event_source_index = number_of_event_sources
+    self._written_event_source_index = self._first_written_event_source_index
 
   # TODO: refactor into base writer.
   def WriteTaskCompletion(self, task):
@@ -2,7 +2,8 @@
 """The storage writer."""
 
 import abc
-import collections
+import array
+import itertools
 
 from plaso.containers import event_sources
 from plaso.containers import events
@@ -36,7 +37,9 @@ class StorageWriter(object):
       storage_type (Optional[str]): storage type.
     """
     super(StorageWriter, self).__init__()
-    self._attribute_containers_counter = collections.Counter()
+    # The number of attribute containers written per container type
+    # identifier (CONTAINER_TYPE_ID).
+    self._attribute_containers_counter = array.array('q')
     self._first_written_event_source_index = 0
     self._serializers_profiler = None
     self._storage_profiler = None
@@ -47,47 +50,100 @@ class StorageWriter(object):
   @property
   def number_of_analysis_reports(self):
     """int: number of analysis reports warnings written."""
-    return self._attribute_containers_counter[
-        self._CONTAINER_TYPE_ANALYSIS_REPORT]
+    return self._GetNumberOfAttributeContainers(
+        reports.AnalysisReport.CONTAINER_TYPE_ID)
 
   @property
   def number_of_analysis_warnings(self):
     """int: number of analysis warnings written."""
-    return self._attribute_containers_counter[
-        self._CONTAINER_TYPE_ANALYSIS_WARNING]
+    return self._GetNumberOfAttributeContainers(
+        warnings.AnalysisWarning.CONTAINER_TYPE_ID)
 
   @property
   def number_of_event_sources(self):
     """int: number of event sources written."""
-    return self._attribute_containers_counter[self._CONTAINER_TYPE_EVENT_SOURCE]
+    return self._GetNumberOfAttributeContainers(
+        event_sources.EventSource.CONTAINER_TYPE_ID)
 
   @property
   def number_of_event_tags(self):
     """int: number of event tags written."""
-    return self._attribute_containers_counter[self._CONTAINER_TYPE_EVENT_TAG]
+    return self._GetNumberOfAttributeContainers(
+        events.EventTag.CONTAINER_TYPE_ID)
 
   @property
   def number_of_events(self):
     """int: number of events written."""
-    return self._attribute_containers_counter[self._CONTAINER_TYPE_EVENT]
+    return self._GetNumberOfAttributeContainers(
+        events.EventObject.CONTAINER_TYPE_ID)
 
   @property
   def number_of_extraction_warnings(self):
     """int: number of extraction warnings written."""
-    return self._attribute_containers_counter[
-        self._CONTAINER_TYPE_EXTRACTION_WARNING]
+    return self._GetNumberOfAttributeContainers(
+        warnings.ExtractionWarning.CONTAINER_TYPE_ID)
 
   @property
   def number_of_preprocessing_warnings(self):
     """int: number of preprocessing warnings written."""
-    return self._attribute_containers_counter[
-        self._CONTAINER_TYPE_PREPROCESSING_WARNING]
+    return self._GetNumberOfAttributeContainers(
+        warnings.PreprocessingWarning.CONTAINER_TYPE_ID)
 
   @property
   def number_of_recovery_warnings(self):
     """int: number of recovery warnings written."""
-    return self._attribute_containers_counter[
-        self._CONTAINER_TYPE_RECOVERY_WARNING]
+    return self._GetNumberOfAttributeContainers(
+        warnings.RecoveryWarning.CONTAINER_TYPE_ID)
+
+  def _GetNumberOfAttributeContainers(self, container_type_identifier):
+    """Retrieves the number of a specific type of attribute containers written.
+
+    Args:
+      container_type_identifier (int): attribute container type identifier.
+
+    Returns:
+      int: number of attribute containers written.
+    """
+    if container_type_identifier >= len(self._attribute_containers_counter):
+      return 0
+
+    return self._attribute_containers_counter[container_type_identifier]
+
+  def _GetContainerTypeIdentifier(self, container):
+    """Retrieves the container type identifier of an attribute container.
+
+    Args:
+      container (AttributeContainer): attribute container.
+
+    Returns:
+      int: attribute container type identifier.
+
+    Raises:
+      ValueError: if the attribute container type is not registered.
+    """
+    container_type_identifier = container.CONTAINER_TYPE_ID
+    if container_type_identifier is None:
+      raise ValueError(
+          'Unsupported attribute container type: {0!s} not registered.'.format(
+              container.CONTAINER_TYPE))
+
+    return container_type_identifier
+
+  def _IncreaseNumberOfAttributeContainers(
+      self, container_type_identifier, number_of_containers):
+    """Increases the number of a specific type of attribute containers written.
+
+    Args:
+      container_type_identifier (int): attribute container type identifier.
+      number_of_containers (int): number of attribute containers to add.
+    """
+    number_of_container_types = len(self._attribute_containers_counter)
+    if container_type_identifier >= number_of_container_types:
+      self._attribute_containers_counter.extend(
+          [0] * (container_type_identifier - number_of_container_types + 1))
+
+    self._attribute_containers_counter[container_type_identifier] += (
+        number_of_containers)
 
   def _RaiseIfNotWritable(self):
     """Raises if the storage writer is not writable.
@@ -108,12 +164,46 @@ class StorageWriter(object):
     Raises:
       IOError: when the storage writer is closed.
       OSError: when the storage writer is closed.
+      ValueError: if the attribute container type is not registered.
     """
     self._RaiseIfNotWritable()
 
+    container_type_identifier = self._GetContainerTypeIdentifier(container)
+
     self._store.AddAttributeContainer(container)
 
-    self._attribute_containers_counter[container.CONTAINER_TYPE] += 1
+    self._IncreaseNumberOfAttributeContainers(container_type_identifier, 1)
+
+  def AddAttributeContainers(self, containers):
+    """Adds attribute containers.
+
+    The number of attribute containers written is updated once per
+    consecutive run of attribute containers of the same type, including
+    when adding an attribute container fails partway through a run.
+
+    Args:
+      containers (iterable[AttributeContainer]): attribute containers.
+
+    Raises:
+      IOError: when the storage writer is closed.
+      OSError: when the storage writer is closed.
+      ValueError: if an attribute container type is not registered.
+    """
+    self._RaiseIfNotWritable()
+
+    add_attribute_container = self._store.AddAttributeContainer
+
+    for container_type_identifier, group in itertools.groupby(
+        containers, key=self._GetContainerTypeIdentifier):
+      number_of_containers = 0
+      try:
+        for container in group:
+          add_attribute_container(container)
+          number_of_containers += 1
+
+      finally:
+        self._IncreaseNumberOfAttributeContainers(
+            container_type_identifier, number_of_containers)
 
   def AddOrUpdateEventTag(self, event_tag):
     """Adds a new or updates an existing event tag.
@@ -34,6 +34,10 @@ class AttributeContainersManagerTest(shared_test_lib.BaseTestCase):
         len(manager.AttributeContainersManager._attribute_container_classes),
         number_of_classes + 1)
 
+    container_type_identifier = (
+        test_lib.TestAttributeContainer.CONTAINER_TYPE_ID)
+    self.assertIsNotNone(container_type_identifier)
+
     with self.assertRaises(KeyError):
       manager.AttributeContainersManager.RegisterAttributeContainer(
           test_lib.TestAttributeContainer)
@@ -44,6 +48,17 @@ class AttributeContainersManagerTest(shared_test_lib.BaseTestCase):
         len(manager.AttributeContainersManager._attribute_container_classes),
         number_of_classes)
 
+    self.assertIsNone(test_lib.TestAttributeContainer.CONTAINER_TYPE_ID)
+
+    manager.AttributeContainersManager.RegisterAttributeContainer(
+        test_lib.TestAttributeContainer)
+    self.assertEqual(
+        test_lib.TestAttributeContainer.CONTAINER_TYPE_ID,
+        container_type_identifier)
+
+    manager.AttributeContainersManager.DeregisterAttributeContainer(
+        test_lib.TestAttributeContainer)
+
 
 if __name__ == '__main__':
   unittest.main()
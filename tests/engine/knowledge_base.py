@@ -127,6 +127,32 @@ class KnowledgeBaseTest(shared_test_lib.BaseTestCase):
     with self.assertRaises(KeyError):
       knowledge_base_object.AddUserAccount(user_account)
 
+    user_account = artifacts.UserAccountArtifact(
+        identifier='0', user_directory='/root', username='root')
+    knowledge_base_object.AddUserAccount(user_account)
+
+    user_account = artifacts.UserAccountArtifact(
+        identifier='1001', user_directory='/home/otheruser',
+        username='otheruser')
+    knowledge_base_object.AddUserAccount(user_account)
+
+    identifiers = [
+        user_account.identifier
+        for user_account in knowledge_base_object.user_accounts]
+    self.assertEqual(identifiers, ['0', '1000', '1001'])
+
+    user_account = artifacts.UserAccountArtifact(
+        identifier=2, user_directory='/home/intuser', username='intuser')
+    knowledge_base_object.AddUserAccount(user_account)
+
+    identifiers = [
+        user_account.identifier
+        for user_account in knowledge_base_object.user_accounts]
+    self.assertEqual(identifiers, ['0', '1000', '1001', 2])
+
+    # The user accounts cannot be changed through the property.
+    self.assertIsInstance(knowledge_base_object.user_accounts, tuple)
+
   def testAddEnvironmentVariable(self):
     """Tests the AddEnvironmentVariable function."""
     knowledge_base_object = knowledge_base.KnowledgeBase()
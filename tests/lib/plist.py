@@ -2,6 +2,8 @@
 # -*- coding: utf-8 -*-
 """Tests for the plist library functions."""
 
+import datetime
+import io
 import unittest
 
 from plaso.lib import plist
@@ -12,6 +14,34 @@ from tests import test_lib as shared_test_lib
 class PlistTests(shared_test_lib.BaseTestCase):
   """Class to test the plist file."""
 
+  _XML_PLIST_DATA = b"""\
+<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" \
+"http://www.apple.com/DTDs/PropertyList-1.0.dtd">
+<plist version="1.0">
+<dict>
+\t<!-- comment -->
+\t<key>Array</key>
+\t<array>
+\t\t<string>first</string>
+\t\t<string></string>
+\t</array>
+\t<key>Data</key>
+\t<data>cGxhc28=</data>
+\t<key>Date</key>
+\t<date>2013-10-16T07:35:56Z</date>
+\t<key>False</key>
+\t<false/>
+\t<key>Integer</key>
+\t<integer>-12</integer>
+\t<key>Real</key>
+\t<real>1.5</real>
+\t<key>True</key>
+\t<true/>
+</dict>
+</plist>
+"""
+
   def testGetValueByPath(self):
     """Tests the GetValueByPath function."""
     test_file_path = self._GetTestFilePath(['com.apple.HIToolbox.plist'])
@@ -49,6 +79,90 @@ class PlistTests(shared_test_lib.BaseTestCase):
 
       self.assertIsNotNone(plist_file.root_key)
 
+  def testReadXMLData(self):
+    """Tests the Read function on XML plist data."""
+    file_object = io.BytesIO(self._XML_PLIST_DATA)
+
+    plist_file = plist.PlistFile()
+    plist_file.Read(file_object)
+
+    expected_root_key = {
+        'Array': ['first', ''],
+        'Data': b'plaso',
+        'Date': datetime.datetime(2013, 10, 16, 7, 35, 56),
+        'False': False,
+        'Integer': -12,
+        'Real': 1.5,
+        'True': True}
+    self.assertEqual(plist_file.root_key, expected_root_key)
+
+  def testReadXMLDataWithoutRootElement(self):
+    """Tests the Read function on XML plist data without root element."""
+    file_object = io.BytesIO(b'<plist version="1.0"></plist>')
+
+    plist_file = plist.PlistFile()
+    plist_file.Read(file_object)
+
+    self.assertIsNone(plist_file.root_key)
+
+  def testReadXMLDataWithTruncatedDate(self):
+    """Tests the Read function on XML plist data with a truncated date."""
+    file_object = io.BytesIO(
+        b'<plist version="1.0"><date>2020-01-01T00:00Z</date></plist>')
+
+    plist_file = plist.PlistFile()
+    plist_file.Read(file_object)
+
+    self.assertEqual(plist_file.root_key, datetime.datetime(2020, 1, 1, 0, 0))
+
+  def testReadXMLDataWithDeepNesting(self):
+    """Tests the Read function on XML plist data with deeply nested values."""
+    file_object = io.BytesIO(b''.join([
+        b'<plist version="1.0">', b'<array>' * 300, b'<true/>',
+        b'</array>' * 300, b'</plist>']))
+
+    plist_file = plist.PlistFile()
+    plist_file.Read(file_object)
+
+    root_key = plist_file.root_key
+    for _ in range(300):
+      self.assertIsInstance(root_key, list)
+      self.assertEqual(len(root_key), 1)
+      root_key = root_key[0]
+
+    self.assertTrue(root_key)
+
+  def testReadXMLDataWithEntityDeclaration(self):
+    """Tests the Read function on XML plist data with an entity declaration."""
+    file_object = io.BytesIO(
+        b'<?xml version="1.0" encoding="UTF-8"?>\n'
+        b'<!DOCTYPE plist [<!ENTITY x "abc">]>\n'
+        b'<plist version="1.0"><string>1&x;2</string></plist>\n')
+
+    plist_file = plist.PlistFile()
+    with self.assertRaises(IOError):
+      plist_file.Read(file_object)
+
+  def testReadXMLDataWithLargeText(self):
+    """Tests the Read function on XML plist data with a large text value."""
+    value = 'a' * (11 * 1024 * 1024)
+    file_object = io.BytesIO(b''.join([
+        b'<plist version="1.0"><string>', value.encode('ascii'),
+        b'</string></plist>']))
+
+    plist_file = plist.PlistFile()
+    plist_file.Read(file_object)
+
+    self.assertEqual(plist_file.root_key, value)
+
+  def testReadXMLDataInvalid(self):
+    """Tests the Read function on invalid XML plist data."""
+    file_object = io.BytesIO(b'<plist><dict><key>bogus</key></dict></plist>')
+
+    plist_file = plist.PlistFile()
+    with self.assertRaises(IOError):
+      plist_file.Read(file_object)
+
 
 if __name__ == '__main__':
   unittest.main()
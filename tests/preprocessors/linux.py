@@ -254,9 +254,7 @@ class LinuxUserAccountsPluginTest(test_lib.ArtifactPreprocessorPluginTestCase):
 
     self.assertEqual(storage_writer.number_of_preprocessing_warnings, 0)
 
-    users = sorted(
-        test_mediator.knowledge_base.user_accounts,
-        key=lambda user_account: user_account.identifier)
+    users = list(test_mediator.knowledge_base.user_accounts)
     self.assertEqual(len(users), 13)
 
     user_account = users[4]
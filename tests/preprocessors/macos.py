@@ -12,49 +12,66 @@ from plaso.preprocessors import macos
 from tests.preprocessors import test_lib
 
 
+_ROOT_MOUNT_POINT = fake_path_spec.FakePathSpec(location='/')
+
+
+# Note that is only part of the normal preferences.plist file data.
+_HOSTNAME_PLIST_DATA = (
+    b'<?xml version="1.0" encoding="UTF-8"?>\n'
+    b'<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" '
+    b'"http://www.apple.com/DTDs/PropertyList-1.0.dtd">\n'
+    b'<plist version="1.0">\n'
+    b'<dict>\n'
+    b'\t<key>System</key>\n'
+    b'\t<dict>\n'
+    b'\t\t<key>Network</key>\n'
+    b'\t\t<dict>\n'
+    b'\t\t\t<key>HostNames</key>\n'
+    b'\t\t\t<dict>\n'
+    b'\t\t\t\t<key>LocalHostName</key>\n'
+    b'\t\t\t\t<string>Plaso\'s Mac mini</string>\n'
+    b'\t\t\t</dict>\n'
+    b'\t\t</dict>\n'
+    b'\t\t<key>System</key>\n'
+    b'\t\t<dict>\n'
+    b'\t\t\t<key>ComputerName</key>\n'
+    b'\t\t\t<string>Plaso\'s Mac mini</string>\n'
+    b'\t\t\t<key>ComputerNameEncoding</key>\n'
+    b'\t\t\t<integer>0</integer>\n'
+    b'\t\t</dict>\n'
+    b'\t</dict>\n'
+    b'</dict>\n'
+    b'</plist>\n')
+
+
+_SYSTEM_VERSION_PLIST_DATA = (
+    b'<?xml version="1.0" encoding="UTF-8"?>\n'
+    b'<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" '
+    b'"http://www.apple.com/DTDs/PropertyList-1.0.dtd">\n'
+    b'<plist version="1.0">\n'
+    b'<dict>\n'
+    b'\t<key>ProductBuildVersion</key>\n'
+    b'\t<string>13C64</string>\n'
+    b'\t<key>ProductCopyright</key>\n'
+    b'\t<string>1983-2014 Apple Inc.</string>\n'
+    b'\t<key>ProductName</key>\n'
+    b'\t<string>Mac OS X</string>\n'
+    b'\t<key>ProductUserVisibleVersion</key>\n'
+    b'\t<string>10.9.2</string>\n'
+    b'\t<key>ProductVersion</key>\n'
+    b'\t<string>10.9.2</string>\n'
+    b'</dict>\n'
+    b'</plist>\n')
+
+
 class MacOSHostnamePluginTest(test_lib.ArtifactPreprocessorPluginTestCase):
   """Tests for the MacOS hostname plugin."""
 
-  # Note that is only part of the normal preferences.plist file data.
-  _FILE_DATA = (
-      b'<?xml version="1.0" encoding="UTF-8"?>\n'
-      b'<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" '
-      b'"http://www.apple.com/DTDs/PropertyList-1.0.dtd">\n'
-      b'<plist version="1.0">\n'
-      b'<dict>\n'
-      b'\t<key>System</key>\n'
-      b'\t<dict>\n'
-      b'\t\t<key>Network</key>\n'
-      b'\t\t<dict>\n'
-      b'\t\t\t<key>HostNames</key>\n'
-      b'\t\t\t<dict>\n'
-      b'\t\t\t\t<key>LocalHostName</key>\n'
-      b'\t\t\t\t<string>Plaso\'s Mac mini</string>\n'
-      b'\t\t\t</dict>\n'
-      b'\t\t</dict>\n'
-      b'\t\t<key>System</key>\n'
-      b'\t\t<dict>\n'
-      b'\t\t\t<key>ComputerName</key>\n'
-      b'\t\t\t<string>Plaso\'s Mac mini</string>\n'
-      b'\t\t\t<key>ComputerNameEncoding</key>\n'
-      b'\t\t\t<integer>0</integer>\n'
-      b'\t\t</dict>\n'
-      b'\t</dict>\n'
-      b'</dict>\n'
-      b'</plist>\n')
-
   def testParsePlistKeyValue(self):
     """Tests the _ParsePlistKeyValue function."""
-    file_system_builder = fake_file_system_builder.FakeFileSystemBuilder()
-    file_system_builder.AddFile(
-        '/Library/Preferences/SystemConfiguration/preferences.plist',
-        self._FILE_DATA)
-
-    mount_point = fake_path_spec.FakePathSpec(location='/')
-
     plugin = macos.MacOSHostnamePlugin()
-    test_mediator = self._RunPreprocessorPluginOnFileSystem(
-        file_system_builder.file_system, mount_point, None, plugin)
+    test_mediator = self._RunPreprocessorPluginOnFileData(
+        _HOSTNAME_PLIST_DATA, None, plugin)
 
     self.assertEqual(test_mediator.knowledge_base.hostname, 'Plaso\'s Mac mini')
 
@@ -72,11 +89,9 @@ class MacOSKeyboardLayoutPluginTest(
     file_system_builder.AddFileReadData(
         '/Library/Preferences/com.apple.HIToolbox.plist', test_file_path)
 
-    mount_point = fake_path_spec.FakePathSpec(location='/')
-
     plugin = macos.MacOSKeyboardLayoutPlugin()
     test_mediator = self._RunPreprocessorPluginOnFileSystem(
-        file_system_builder.file_system, mount_point, None, plugin)
+        file_system_builder.file_system, _ROOT_MOUNT_POINT, None, plugin)
 
     keyboard_layout = test_mediator.knowledge_base.GetValue('keyboard_layout')
     self.assertEqual(keyboard_layout, 'US')
@@ -85,37 +100,11 @@ class MacOSKeyboardLayoutPluginTest(
 class MacOSSystemVersionPluginTest(test_lib.ArtifactPreprocessorPluginTestCase):
   """Tests for the MacOS system version information plugin."""
 
-  _FILE_DATA = (
-      b'<?xml version="1.0" encoding="UTF-8"?>\n'
-      b'<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" '
-      b'"http://www.apple.com/DTDs/PropertyList-1.0.dtd">\n'
-      b'<plist version="1.0">\n'
-      b'<dict>\n'
-      b'\t<key>ProductBuildVersion</key>\n'
-      b'\t<string>13C64</string>\n'
-      b'\t<key>ProductCopyright</key>\n'
-      b'\t<string>1983-2014 Apple Inc.</string>\n'
-      b'\t<key>ProductName</key>\n'
-      b'\t<string>Mac OS X</string>\n'
-      b'\t<key>ProductUserVisibleVersion</key>\n'
-      b'\t<string>10.9.2</string>\n'
-      b'\t<key>ProductVersion</key>\n'
-      b'\t<string>10.9.2</string>\n'
-      b'</dict>\n'
-      b'</plist>\n')
-
   def testParsePlistKeyValue(self):
     """Tests the _ParsePlistKeyValue function."""
-    file_system_builder = fake_file_system_builder.FakeFileSystemBuilder()
-    file_system_builder.AddFile(
-        '/System/Library/CoreServices/SystemVersion.plist',
-        self._FILE_DATA)
-
-    mount_point = fake_path_spec.FakePathSpec(location='/')
-
     plugin = macos.MacOSSystemVersionPlugin()
-    test_mediator = self._RunPreprocessorPluginOnFileSystem(
-        file_system_builder.file_system, mount_point, None, plugin)
+    test_mediator = self._RunPreprocessorPluginOnFileData(
+        _SYSTEM_VERSION_PLIST_DATA, None, plugin)
 
     build = test_mediator.knowledge_base.GetValue('operating_system_version')
     self.assertEqual(build, '10.9.2')
@@ -130,13 +119,12 @@ class MacOSTimeZonePluginTest(test_lib.ArtifactPreprocessorPluginTestCase):
     file_system_builder.AddSymbolicLink(
         '/private/etc/localtime', '/usr/share/zoneinfo/Europe/Amsterdam')
 
-    mount_point = fake_path_spec.FakePathSpec(location='/')
-
     storage_writer = self._CreateTestStorageWriter()
 
     plugin = macos.MacOSTimeZonePlugin()
     test_mediator = self._RunPreprocessorPluginOnFileSystem(
-        file_system_builder.file_system, mount_point, storage_writer, plugin)
+        file_system_builder.file_system, _ROOT_MOUNT_POINT, storage_writer,
+        plugin)
 
     self.assertEqual(storage_writer.number_of_preprocessing_warnings, 0)
 
@@ -149,13 +137,12 @@ class MacOSTimeZonePluginTest(test_lib.ArtifactPreprocessorPluginTestCase):
     file_system_builder.AddSymbolicLink(
         '/private/etc/localtime', '/usr/share/zoneinfo/Bogus')
 
-    mount_point = fake_path_spec.FakePathSpec(location='/')
-
     storage_writer = self._CreateTestStorageWriter()
 
     plugin = macos.MacOSTimeZonePlugin()
     test_mediator = self._RunPreprocessorPluginOnFileSystem(
-        file_system_builder.file_system, mount_point, storage_writer, plugin)
+        file_system_builder.file_system, _ROOT_MOUNT_POINT, storage_writer,
+        plugin)
 
     self.assertEqual(storage_writer.number_of_preprocessing_warnings, 1)
 
@@ -177,19 +164,16 @@ class MacOSUserAccountsPluginTest(test_lib.ArtifactPreprocessorPluginTestCase):
         '/private/var/db/dslocal/nodes/Default/users/nobody.plist',
         test_file_path)
 
-    mount_point = fake_path_spec.FakePathSpec(location='/')
-
     storage_writer = self._CreateTestStorageWriter()
 
     plugin = macos.MacOSUserAccountsPlugin()
     test_mediator = self._RunPreprocessorPluginOnFileSystem(
-        file_system_builder.file_system, mount_point, storage_writer, plugin)
+        file_system_builder.file_system, _ROOT_MOUNT_POINT, storage_writer,
+        plugin)
 
     self.assertEqual(storage_writer.number_of_preprocessing_warnings, 0)
 
-    users = sorted(
-        test_mediator.knowledge_base.user_accounts,
-        key=lambda user_account: user_account.identifier)
+    users = list(test_mediator.knowledge_base.user_accounts)
     self.assertEqual(len(users), 1)
 
     user_account = users[0]
@@ -209,13 +193,12 @@ class MacOSUserAccountsPluginTest(test_lib.ArtifactPreprocessorPluginTestCase):
         '/private/var/db/dslocal/nodes/Default/users/nobody.plist',
         test_file_path)
 
-    mount_point = fake_path_spec.FakePathSpec(location='/')
-
     storage_writer = self._CreateTestStorageWriter()
 
     plugin = macos.MacOSUserAccountsPlugin()
     self._RunPreprocessorPluginOnFileSystem(
-        file_system_builder.file_system, mount_point, storage_writer, plugin)
+        file_system_builder.file_system, _ROOT_MOUNT_POINT, storage_writer,
+        plugin)
 
     self.assertEqual(storage_writer.number_of_preprocessing_warnings, 1)
 
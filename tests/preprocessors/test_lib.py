@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 """Preprocessing related functions and classes for testing."""
 
+import io
+
 from artifacts import reader as artifacts_reader
 from artifacts import registry as artifacts_registry
 from dfvfs.helpers import fake_file_system_builder
@@ -71,6 +73,32 @@ class ArtifactPreprocessorPluginTestCase(shared_test_lib.BaseTestCase):
 
     return test_mediator
 
+  def _RunPreprocessorPluginOnFileData(self, file_data, storage_writer, plugin):
+    """Runs a file artifact preprocessor plugin on file data.
+
+    This bypasses the artifact definition and file system searching, for
+    tests that only need to cover the parsing of the file data.
+
+    Args:
+      file_data (bytes): file data to be preprocessed.
+      storage_writer (StorageWriter): storage writer.
+      plugin (FileArtifactPreprocessorPlugin): preprocessor plugin.
+
+    Return:
+      PreprocessMediator: preprocess mediator.
+    """
+    session = sessions.Session()
+    test_knowledge_base = knowledge_base.KnowledgeBase()
+    test_mediator = mediator.PreprocessMediator(
+        session, storage_writer, test_knowledge_base)
+
+    file_object = io.BytesIO(file_data)
+
+    # pylint: disable=protected-access
+    plugin._ParseFileData(test_mediator, file_object)
+
+    return test_mediator
+
   def _RunPreprocessorPluginOnWindowsRegistryValue(
       self, file_system, mount_point, storage_writer, plugin):
     """Runs a preprocessor plugin on a Windows Registry value.
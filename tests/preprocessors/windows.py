@@ -4,13 +4,19 @@
 
 import unittest
 
+from unittest import mock
+
 from dfvfs.helpers import fake_file_system_builder
+from dfvfs.helpers import file_system_searcher
 from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.path import factory as path_spec_factory
+from dfwinreg import definitions as dfwinreg_definitions
+from dfwinreg import fake as dfwinreg_fake
 
 from plaso.containers import artifacts
 from plaso.containers import sessions
 from plaso.engine import knowledge_base
+from plaso.lib import errors
 from plaso.preprocessors import mediator
 from plaso.preprocessors import windows
 
@@ -192,6 +198,14 @@ class WindowsAvailableTimeZonesPluginTest(
     test_lib.ArtifactPreprocessorPluginTestCase):
   """Tests for the Windows available time zones plugin."""
 
+  # pylint: disable=protected-access
+
+  _TZI_VALUE_DATA = bytes(bytearray([
+      0xc4, 0xff, 0xff, 0xff, 0x00, 0x00, 0x00, 0x00, 0xc4, 0xff, 0xff, 0xff,
+      0x00, 0x00, 0x0a, 0x00, 0x00, 0x00, 0x05, 0x00, 0x03, 0x00, 0x00, 0x00,
+      0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x03, 0x00, 0x00, 0x00, 0x05, 0x00,
+      0x02, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00]))
+
   def testParseKey(self):
     """Tests the _ParseKey function."""
     test_file_path = self._GetTestFilePath(['SOFTWARE'])
@@ -213,10 +227,89 @@ class WindowsAvailableTimeZonesPluginTest(
 
     self.assertEqual(available_time_zones[0].name, 'AUS Central Standard Time')
 
+  def testParseKeyWithFakeKey(self):
+    """Tests the _ParseKey function on a fake Windows Registry key."""
+    key_path = (
+        'HKEY_LOCAL_MACHINE\\Software\\Microsoft\\Windows NT\\CurrentVersion\\'
+        'Time Zones\\W. Europe Standard Time')
+    registry_key = dfwinreg_fake.FakeWinRegistryKey(
+        'W. Europe Standard Time', key_path=key_path)
+
+    value_data = 'West-Europa (standaardtijd)'.encode('utf-16-le')
+    registry_value = dfwinreg_fake.FakeWinRegistryValue(
+        'Std', data=value_data, data_type=dfwinreg_definitions.REG_SZ)
+    registry_key.AddValue(registry_value)
+
+    value_data = '@tzres.dll,-321'.encode('utf-16-le')
+    registry_value = dfwinreg_fake.FakeWinRegistryValue(
+        'MUI_Std', data=value_data, data_type=dfwinreg_definitions.REG_SZ)
+    registry_key.AddValue(registry_value)
+
+    registry_value = dfwinreg_fake.FakeWinRegistryValue(
+        'TZI', data=self._TZI_VALUE_DATA,
+        data_type=dfwinreg_definitions.REG_BINARY)
+    registry_key.AddValue(registry_value)
+
+    session = sessions.Session()
+    storage_writer = self._CreateTestStorageWriter()
+    test_knowledge_base = knowledge_base.KnowledgeBase()
+    test_mediator = mediator.PreprocessMediator(
+        session, storage_writer, test_knowledge_base)
+
+    plugin = windows.WindowsAvailableTimeZonesPlugin()
+    plugin._ParseKey(test_mediator, registry_key, None)
+
+    self.assertEqual(storage_writer.number_of_preprocessing_warnings, 0)
+
+    available_time_zones = list(test_knowledge_base.available_time_zones)
+    self.assertEqual(len(available_time_zones), 1)
+
+    time_zone_artifact = available_time_zones[0]
+    self.assertEqual(
+        time_zone_artifact.localized_name, 'West-Europa (standaardtijd)')
+    self.assertEqual(time_zone_artifact.mui_form, '@tzres.dll,-321')
+    self.assertEqual(time_zone_artifact.name, 'W. Europe Standard Time')
+    self.assertEqual(time_zone_artifact.offset, -60)
+
+  def testParseKeyWithoutTZIValue(self):
+    """Tests the _ParseKey function on a key without a TZI value."""
+    key_path = (
+        'HKEY_LOCAL_MACHINE\\Software\\Microsoft\\Windows NT\\CurrentVersion\\'
+        'Time Zones\\W. Europe Standard Time')
+    registry_key = dfwinreg_fake.FakeWinRegistryKey(
+        'W. Europe Standard Time', key_path=key_path)
+
+    session = sessions.Session()
+    storage_writer = self._CreateTestStorageWriter()
+    test_knowledge_base = knowledge_base.KnowledgeBase()
+    test_mediator = mediator.PreprocessMediator(
+        session, storage_writer, test_knowledge_base)
+
+    plugin = windows.WindowsAvailableTimeZonesPlugin()
+    plugin._ParseKey(test_mediator, registry_key, None)
+
+    self.assertEqual(storage_writer.number_of_preprocessing_warnings, 1)
+
+    available_time_zones = list(test_knowledge_base.available_time_zones)
+    self.assertEqual(len(available_time_zones), 0)
+
+  def testParseTZIValue(self):
+    """Tests the _ParseTZIValue function."""
+    plugin = windows.WindowsAvailableTimeZonesPlugin()
+
+    time_zone_artifact = artifacts.TimeZoneArtifact(name='test')
+    plugin._ParseTZIValue(self._TZI_VALUE_DATA, time_zone_artifact)
+    self.assertEqual(time_zone_artifact.offset, -60)
+
+    with self.assertRaises(errors.ParseError):
+      plugin._ParseTZIValue(self._TZI_VALUE_DATA[:16], time_zone_artifact)
+
 
 class WindowsCodepagePlugin(test_lib.ArtifactPreprocessorPluginTestCase):
   """Tests for the Windows codepage plugin."""
 
+  # pylint: disable=protected-access
+
   def testParseValueData(self):
     """Tests the _ParseValueData function."""
     test_file_path = self._GetTestFilePath(['SYSTEM'])
@@ -232,6 +325,74 @@ class WindowsCodepagePlugin(test_lib.ArtifactPreprocessorPluginTestCase):
 
     self.assertEqual(test_mediator.knowledge_base.codepage, 'cp1252')
 
+  def testParseValueDataWithUnsupportedType(self):
+    """Tests the _ParseValueData function with an unsupported value type."""
+    session = sessions.Session()
+    storage_writer = self._CreateTestStorageWriter()
+    test_knowledge_base = knowledge_base.KnowledgeBase()
+    test_mediator = mediator.PreprocessMediator(
+        session, storage_writer, test_knowledge_base)
+
+    plugin = windows.WindowsCodepagePlugin()
+
+    with self.assertRaises(errors.PreProcessFail):
+      plugin._ParseValueData(test_mediator, 1252)
+
+
+class WindowsEventLogProvidersPluginTest(
+    test_lib.ArtifactPreprocessorPluginTestCase):
+  """Tests for the Windows Event Log providers plugin."""
+
+  # pylint: disable=protected-access
+
+  def testParseKey(self):
+    """Tests the _ParseKey function."""
+    key_path = (
+        'HKEY_LOCAL_MACHINE\\System\\CurrentControlSet\\Services\\EventLog\\'
+        'Application\\Windows Search Service')
+    registry_key = dfwinreg_fake.FakeWinRegistryKey(
+        'Windows Search Service', key_path=key_path)
+
+    value_data = '%systemroot%\\system32\\tquery.dll'.encode('utf-16-le')
+    registry_value = dfwinreg_fake.FakeWinRegistryValue(
+        'EventMessageFile', data=value_data,
+        data_type=dfwinreg_definitions.REG_EXPAND_SZ)
+    registry_key.AddValue(registry_value)
+
+    registry_value = dfwinreg_fake.FakeWinRegistryValue(
+        'ParameterMessageFile', data=b'',
+        data_type=dfwinreg_definitions.REG_EXPAND_SZ)
+    registry_key.AddValue(registry_value)
+
+    session = sessions.Session()
+    storage_writer = self._CreateTestStorageWriter()
+    test_knowledge_base = knowledge_base.KnowledgeBase()
+    test_mediator = mediator.PreprocessMediator(
+        session, storage_writer, test_knowledge_base)
+
+    plugin = windows.WindowsEventLogProvidersPlugin()
+    plugin._ParseKey(test_mediator, registry_key, None)
+
+    self.assertEqual(storage_writer.number_of_preprocessing_warnings, 0)
+
+    source_configurations = (
+        test_knowledge_base.GetSourceConfigurationArtifacts())
+    system_configuration = source_configurations[0].system_configuration
+
+    windows_eventlog_providers = (
+        system_configuration.windows_eventlog_providers)
+    self.assertEqual(len(windows_eventlog_providers), 1)
+
+    windows_eventlog_provider = windows_eventlog_providers[0]
+    self.assertIsNone(windows_eventlog_provider.category_message_files)
+    self.assertEqual(
+        windows_eventlog_provider.event_message_files,
+        ['%systemroot%\\system32\\tquery.dll'])
+    self.assertEqual(windows_eventlog_provider.log_source,
+                     'Windows Search Service')
+    self.assertEqual(windows_eventlog_provider.log_type, 'Application')
+    self.assertIsNone(windows_eventlog_provider.parameter_message_files)
+
 
 class WindowsHostnamePluginTest(test_lib.ArtifactPreprocessorPluginTestCase):
   """Tests for the Windows hostname plugin."""
@@ -405,6 +566,8 @@ class WindowsSystemRootEnvironmentVariablePluginTest(
     test_lib.ArtifactPreprocessorPluginTestCase):
   """Tests for the %SystemRoot% environment variable plugin."""
 
+  # pylint: disable=protected-access
+
   _FILE_DATA = b'regf'
 
   def testParsePathSpecification(self):
@@ -425,6 +588,51 @@ class WindowsSystemRootEnvironmentVariablePluginTest(
     self.assertIsNotNone(environment_variable)
     self.assertEqual(environment_variable.value, '\\Windows')
 
+  def testParsePathSpecificationWithPathSeparator(self):
+    """Tests the _ParsePathSpecification function with a path separator."""
+    file_system_builder = fake_file_system_builder.FakeFileSystemBuilder()
+    file_system_builder.AddFile(
+        '/Windows/System32/config/SYSTEM', self._FILE_DATA)
+
+    mount_point = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_FAKE, location='/')
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_FAKE, location='/Windows/System32/')
+
+    searcher = file_system_searcher.FileSystemSearcher(
+        file_system_builder.file_system, mount_point)
+
+    session = sessions.Session()
+    test_knowledge_base = knowledge_base.KnowledgeBase()
+    test_mediator = mediator.PreprocessMediator(
+        session, None, test_knowledge_base)
+
+    plugin = windows.WindowsSystemRootEnvironmentVariablePlugin()
+    plugin._ParsePathSpecification(
+        test_mediator, searcher, file_system_builder.file_system, path_spec,
+        '\\')
+
+    environment_variable = test_mediator.knowledge_base.GetEnvironmentVariable(
+        'SystemRoot')
+    self.assertIsNotNone(environment_variable)
+    self.assertEqual(environment_variable.value, '\\Windows\\System32')
+
+    # Test with a relative path that contains repeated path separators.
+    test_knowledge_base = knowledge_base.KnowledgeBase()
+    test_mediator = mediator.PreprocessMediator(
+        session, None, test_knowledge_base)
+
+    with mock.patch.object(
+        searcher, 'GetRelativePath', return_value='/Windows//System32/'):
+      plugin._ParsePathSpecification(
+          test_mediator, searcher, file_system_builder.file_system, path_spec,
+          '\\')
+
+    environment_variable = test_mediator.knowledge_base.GetEnvironmentVariable(
+        'SystemRoot')
+    self.assertIsNotNone(environment_variable)
+    self.assertEqual(environment_variable.value, '\\Windows\\System32')
+
 
 class WindowsSystemProductPluginTest(
     test_lib.ArtifactPreprocessorPluginTestCase):
@@ -496,6 +704,22 @@ class WindowsUserAccountsPluginTest(
 
   # pylint: disable=protected-access
 
+  def testGetUsernameFromProfilePath(self):
+    """Tests the _GetUsernameFromProfilePath function."""
+    plugin = windows.WindowsUserAccountsPlugin()
+
+    username = plugin._GetUsernameFromProfilePath('C:\\Users\\rsydow')
+    self.assertEqual(username, 'rsydow')
+
+    username = plugin._GetUsernameFromProfilePath('C:\\Users\\rsydow\\\\')
+    self.assertEqual(username, 'rsydow')
+
+    username = plugin._GetUsernameFromProfilePath('rsydow')
+    self.assertEqual(username, 'rsydow')
+
+    username = plugin._GetUsernameFromProfilePath('\\')
+    self.assertEqual(username, '')
+
   def testParseKey(self):
     """Tests the _ParseKey function."""
     test_file_path = self._GetTestFilePath(['SOFTWARE'])
@@ -509,9 +733,7 @@ class WindowsUserAccountsPluginTest(
 
     self.assertEqual(storage_writer.number_of_preprocessing_warnings, 0)
 
-    user_accounts = sorted(
-        test_mediator.knowledge_base.user_accounts,
-        key=lambda user_account: user_account.identifier)
+    user_accounts = list(test_mediator.knowledge_base.user_accounts)
     self.assertIsNotNone(user_accounts)
     self.assertEqual(len(user_accounts), 11)
 
@@ -85,6 +85,22 @@ class EventHeapTest(test_lib.StorageTestCase):
 
     self.assertEqual(len(test_heap._heap), 1)
 
+  def testPushEvents(self):
+    """Tests the PushEvents function."""
+    test_heap = event_heap.EventHeap()
+
+    self.assertEqual(len(test_heap._heap), 0)
+
+    test_events = [
+        (event, event_index) for event_index, (event, _, _) in enumerate(
+            containers_test_lib.CreateEventsFromValues(self._TEST_EVENTS))]
+    test_heap.PushEvents(test_events)
+
+    self.assertEqual(len(test_heap._heap), 2)
+
+    test_event = test_heap.PopEvent()
+    self.assertEqual(test_event.timestamp, 2345871286)
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -4,6 +4,8 @@
 
 import unittest
 
+from unittest import mock
+
 from plaso.containers import events
 from plaso.containers import sessions
 from plaso.containers import tasks
@@ -19,6 +21,14 @@ class FakeStorageWriterTest(test_lib.StorageTestCase):
 
   # pylint: disable=protected-access
 
+  @classmethod
+  def setUpClass(cls):
+    """Makes preparations before running any of the tests."""
+    super(FakeStorageWriterTest, cls).setUpClass()
+
+    cls._session = sessions.Session()
+    cls._task = tasks.Task(session_identifier=cls._session.identifier)
+
   def testAddAttributeContainer(self):
     """Tests the AddAttributeContainer function."""
     event_data_stream = events.EventDataStream()
@@ -26,14 +36,14 @@ class FakeStorageWriterTest(test_lib.StorageTestCase):
     storage_writer = fake_writer.FakeStorageWriter()
     storage_writer.Open()
 
-    number_of_containers = storage_writer._attribute_containers_counter[
-        event_data_stream.CONTAINER_TYPE]
+    number_of_containers = storage_writer._GetNumberOfAttributeContainers(
+        event_data_stream.CONTAINER_TYPE_ID)
     self.assertEqual(number_of_containers, 0)
 
     storage_writer.AddAttributeContainer(event_data_stream)
 
-    number_of_containers = storage_writer._attribute_containers_counter[
-        event_data_stream.CONTAINER_TYPE]
+    number_of_containers = storage_writer._GetNumberOfAttributeContainers(
+        event_data_stream.CONTAINER_TYPE_ID)
     self.assertEqual(number_of_containers, 1)
 
     storage_writer.Close()
@@ -41,6 +51,79 @@ class FakeStorageWriterTest(test_lib.StorageTestCase):
     with self.assertRaises(IOError):
       storage_writer.AddAttributeContainer(event_data_stream)
 
+  def testAddAttributeContainerWithUnregisteredType(self):
+    """Tests the AddAttributeContainer function with an unregistered type."""
+    test_container = containers_test_lib.TestAttributeContainer()
+
+    storage_writer = fake_writer.FakeStorageWriter()
+    storage_writer.Open()
+
+    with self.assertRaises(ValueError):
+      storage_writer.AddAttributeContainer(test_container)
+
+    has_containers = storage_writer._store.HasAttributeContainers(
+        test_container.CONTAINER_TYPE)
+    self.assertFalse(has_containers)
+
+    storage_writer.Close()
+
+  def testAddAttributeContainers(self):
+    """Tests the AddAttributeContainers function."""
+    event_data_streams = [
+        events.EventDataStream(), events.EventDataStream()]
+
+    storage_writer = fake_writer.FakeStorageWriter()
+    storage_writer.Open()
+
+    storage_writer.AddAttributeContainers(event_data_streams)
+
+    number_of_containers = storage_writer._GetNumberOfAttributeContainers(
+        events.EventDataStream.CONTAINER_TYPE_ID)
+    self.assertEqual(number_of_containers, 2)
+
+    container = storage_writer.GetAttributeContainerByIndex(
+        events.EventDataStream.CONTAINER_TYPE, 1)
+    self.assertIsNotNone(container)
+
+    storage_writer.Close()
+
+    with self.assertRaises(IOError):
+      storage_writer.AddAttributeContainers(event_data_streams)
+
+  def testAddAttributeContainersWithStoreFailure(self):
+    """Tests the AddAttributeContainers function when the store fails."""
+    event_data_streams = [
+        events.EventDataStream(), events.EventDataStream(),
+        events.EventDataStream()]
+
+    storage_writer = fake_writer.FakeStorageWriter()
+    storage_writer.Open()
+
+    add_attribute_container = storage_writer._store.AddAttributeContainer
+
+    def _AddAttributeContainer(container):
+      """Adds the first attribute container and fails on the next ones."""
+      if storage_writer._store.HasAttributeContainers(container.CONTAINER_TYPE):
+        raise IOError('Unable to add attribute container.')
+
+      add_attribute_container(container)
+
+    with mock.patch.object(
+        storage_writer._store, 'AddAttributeContainer',
+        side_effect=_AddAttributeContainer):
+      with self.assertRaises(IOError):
+        storage_writer.AddAttributeContainers(event_data_streams)
+
+    number_of_containers = storage_writer._GetNumberOfAttributeContainers(
+        events.EventDataStream.CONTAINER_TYPE_ID)
+    self.assertEqual(number_of_containers, 1)
+
+    number_of_containers = storage_writer._store.GetNumberOfAttributeContainers(
+        events.EventDataStream.CONTAINER_TYPE)
+    self.assertEqual(number_of_containers, 1)
+
+    storage_writer.Close()
+
   # TODO: add tests for AddOrUpdateEventTag
 
   def testGetAttributeContainerByIdentifier(self):
@@ -138,64 +221,78 @@ class FakeStorageWriterTest(test_lib.StorageTestCase):
     with self.assertRaises(IOError):
       storage_writer.Close()
 
+  def testOpenCloseWithAttributeContainers(self):
+    """Tests reopening a storage writer with attribute containers."""
+    event_data_stream = events.EventDataStream()
+
+    storage_writer = fake_writer.FakeStorageWriter()
+    storage_writer.Open()
+
+    storage_writer.AddAttributeContainer(event_data_stream)
+
+    storage_writer.Close()
+
+    storage_writer.Open()
+
+    container = storage_writer.GetAttributeContainerByIndex(
+        event_data_stream.CONTAINER_TYPE, 0)
+    self.assertIsNotNone(container)
+
+    storage_writer.Close()
+
   def testWriteSessionStartAndCompletion(self):
     """Tests the WriteSessionStart and WriteSessionCompletion functions."""
-    session = sessions.Session()
-
     storage_writer = fake_writer.FakeStorageWriter()
     storage_writer.Open()
 
-    storage_writer.WriteSessionStart(session)
-    storage_writer.WriteSessionCompletion(session)
+    storage_writer.WriteSessionStart(self._session)
+    storage_writer.WriteSessionCompletion(self._session)
 
     storage_writer.Close()
 
     with self.assertRaises(IOError):
-      storage_writer.WriteSessionStart(session)
+      storage_writer.WriteSessionStart(self._session)
 
     with self.assertRaises(IOError):
-      storage_writer.WriteSessionCompletion(session)
+      storage_writer.WriteSessionCompletion(self._session)
 
     storage_writer = fake_writer.FakeStorageWriter(
         storage_type=definitions.STORAGE_TYPE_TASK)
     storage_writer.Open()
 
     with self.assertRaises(IOError):
-      storage_writer.WriteSessionStart(session)
+      storage_writer.WriteSessionStart(self._session)
 
     with self.assertRaises(IOError):
-      storage_writer.WriteSessionCompletion(session)
+      storage_writer.WriteSessionCompletion(self._session)
 
     storage_writer.Close()
 
   def testWriteTaskStartAndCompletion(self):
     """Tests the WriteTaskStart and WriteTaskCompletion functions."""
-    session = sessions.Session()
-    task = tasks.Task(session_identifier=session.identifier)
-
     storage_writer = fake_writer.FakeStorageWriter(
         storage_type=definitions.STORAGE_TYPE_TASK)
     storage_writer.Open()
 
-    storage_writer.WriteTaskStart(task)
-    storage_writer.WriteTaskCompletion(task)
+    storage_writer.WriteTaskStart(self._task)
+    storage_writer.WriteTaskCompletion(self._task)
 
     storage_writer.Close()
 
     with self.assertRaises(IOError):
-      storage_writer.WriteTaskStart(task)
+      storage_writer.WriteTaskStart(self._task)
 
     with self.assertRaises(IOError):
-      storage_writer.WriteTaskCompletion(task)
+      storage_writer.WriteTaskCompletion(self._task)
 
     storage_writer = fake_writer.FakeStorageWriter()
     storage_writer.Open()
 
     with self.assertRaises(IOError):
-      storage_writer.WriteTaskStart(task)
+      storage_writer.WriteTaskStart(self._task)
 
     with self.assertRaises(IOError):
-      storage_writer.WriteTaskCompletion(task)
+      storage_writer.WriteTaskCompletion(self._task)
 
     storage_writer.Close()
 